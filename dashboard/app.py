@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import base64
 import time
 import numpy as np
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from datetime import datetime
 from pathlib import Path
 
 # ======================================================
@@ -40,6 +43,18 @@ def get_asset_path(filename):
             return p
     return None
 
+@st.cache_data # Encode once; reruns reuse the cached string
+def _encode_asset(path: str) -> str:
+    """
+    Base64-encodes a static asset for inline embedding.
+    
+    Args:
+        path (str): Asset path (string so it doubles as the cache key).
+    Returns:
+        Base64 string of the file contents.
+    """
+    return base64.b64encode(Path(path).read_bytes()).decode()
+
 # ======================================================
 # MODULE 3: UI/UX & CSS INJECTION
 # ======================================================
@@ -52,7 +67,7 @@ def set_background():
     if bg_path:
         try:
             # Base64 encode to prevent path resolution issues in browser
-            encoded = base64.b64encode(bg_path.read_bytes()).decode()
+            encoded = _encode_asset(str(bg_path))
             st.markdown(
                 f"""
                 <style>
@@ -128,14 +143,15 @@ div[data-testid="stMetric"] {
 div[data-testid="stMetric"] label { color: #00ffff !important; font-family: 'Orbitron'; }
 div[data-testid="stMetricValue"] { color: #fff !important; font-size: 2.2rem !important; font-family: 'Orbitron'; }
 
-/* Tab Container Styling */
-.stTabs [data-baseweb="tab-list"] { gap: 8px; }
-.stTabs [data-baseweb="tab"] {
+/* View Selector Styling (horizontal radio rendered as tabs) */
+div[data-testid="stMain"] div[role="radiogroup"] { gap: 8px; }
+div[data-testid="stMain"] div[role="radiogroup"] label {
     background-color: rgba(0,0,0,0.5);
     color: #00ffff;
     border: 1px solid #00ffff;
+    padding: 6px 14px;
 }
-.stTabs [aria-selected="true"] {
+div[data-testid="stMain"] div[role="radiogroup"] label:has(input:checked) {
     background-color: rgba(0,255,255,0.2) !important;
     color: white !important;
 }
@@ -155,8 +171,17 @@ div[data-testid="stMetricValue"] { color: #fff !important; font-size: 2.2rem !im
 # ======================================================
 # MODULE 4: DATA SIMULATION ENGINE (BACKEND MOCK)
 # ======================================================
-@st.cache_data(ttl=5) # Cache data for 5s to optimize render performance while allowing updates
-def load_live_traffic():
+# Geo-spatial reference points (Indian Ocean Theater)
+CITIES = [
+    ("Mumbai", 19.07, 72.87), ("Kochi", 9.93, 76.26), 
+    ("Chennai", 13.08, 80.27), ("Vizag", 17.68, 83.21),
+    ("Port Blair", 11.62, 92.72), ("Colombo", 6.92, 79.86)
+]
+# (lat, lon) lookup table for fancy-indexing by city index
+CITY_COORDS = np.array([(lat, lon) for _, lat, lon in CITIES])
+
+@st.cache_resource(ttl=5) # Cache frame for 5s; shared object avoids per-hit pickling (copy at call site)
+def _load_live_traffic_cached():
     """
     Generates synthetic telemetry data to simulate high-volume network traffic.
     Includes probabilistic anomaly injection based on 'risk_score'.
@@ -164,48 +189,67 @@ def load_live_traffic():
     rows = 10000  # High-volume simulation parameter
     now = datetime.now()
     
-    # Geo-spatial reference points (Indian Ocean Theater)
-    cities = [
-        ("Mumbai", 19.07, 72.87), ("Kochi", 9.93, 76.26), 
-        ("Chennai", 13.08, 80.27), ("Vizag", 17.68, 83.21),
-        ("Port Blair", 11.62, 92.72), ("Colombo", 6.92, 79.86)
-    ]
-    
     # Vectorized data generation for performance
-    city_indices = np.random.choice(len(cities), rows)
+    city_indices = np.random.choice(len(CITIES), rows)
+    base = CITY_COORDS[city_indices]
+    jitter = np.random.uniform(-0.5, 0.5, size=(rows, 2))
+    o1, o2, o3 = (pd.Series(np.random.randint(0, 256, rows, dtype=np.uint8)).astype(str) for _ in range(3))
     
     data = {
-        "timestamp": [now - timedelta(seconds=i*5) for i in range(rows)],
-        "ip": [f"10.{np.random.randint(0,255)}.{np.random.randint(0,255)}.{np.random.randint(0,255)}" for _ in range(rows)],
+        "timestamp": pd.date_range(start=now, periods=rows, freq="-5s"),
+        "ip": ("10." + o1 + "." + o2 + "." + o3).to_numpy(),
         "req_per_min": np.random.randint(20, 3000, rows),
         "risk_score": np.random.uniform(0.1, 9.9, rows),
-        "lat": [cities[i][1] + np.random.uniform(-0.5,0.5) for i in city_indices], # Add jitter
-        "lon": [cities[i][2] + np.random.uniform(-0.5,0.5) for i in city_indices], # Add jitter
+        "lat": base[:, 0] + jitter[:, 0], # Add jitter
+        "lon": base[:, 1] + jitter[:, 1], # Add jitter
     }
     
     df = pd.DataFrame(data)
     
+    # Downcast numerics (req_per_min < 3000, float32 ample for scores/coords)
+    df["req_per_min"] = df["req_per_min"].astype(np.int16)
+    for col in ("risk_score", "lat", "lon"):
+        df[col] = df[col].astype(np.float32)
+    
     # Anomaly Classification Logic (Threshold > 8.0)
-    df["anomaly_label"] = np.where(df["risk_score"] > 8.0, "Anomaly", "Normal") 
+    # Single mask drives all three label columns; categoricals store int8 codes
+    codes = (df["risk_score"].to_numpy() > 8.0).astype(np.int8)
+    df["anomaly_label"] = pd.Categorical.from_codes(codes, categories=["Normal", "Anomaly"])
     
     # NLP-style Explanation Generation
-    df["explanation"] = np.where(
-        df["anomaly_label"] == "Anomaly",
-        "Traffic pattern deviates >3σ from historical baseline.",
-        "Authorized traffic within standard operating parameters."
+    df["explanation"] = pd.Categorical.from_codes(
+        codes,
+        categories=[
+            "Authorized traffic within standard operating parameters.",
+            "Traffic pattern deviates >3σ from historical baseline."
+        ]
     )
     
     # Automated Countermeasure Logic
-    df["recommended_action"] = np.where(
-        df["anomaly_label"] == "Anomaly",
-        "BLOCK IP / ALERT WATCH OFFICER",
-        "MONITOR"
+    df["recommended_action"] = pd.Categorical.from_codes(
+        codes,
+        categories=["MONITOR", "BLOCK IP / ALERT WATCH OFFICER"]
     )
     
     return df
 
+@st.cache_data(ttl=5, max_entries=3) # One entry per scope; expires with the 5s data TTL
+def make_csv(df: pd.DataFrame) -> bytes:
+    """
+    Serializes a telemetry frame to UTF-8 CSV for the download button.
+    Cached so filter changes and polling reruns reuse the encoded bytes.
+    Uses Arrow's C++ CSV writer instead of the pandas Python writer.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    buf = pa.BufferOutputStream()
+    pa_csv.write_csv(table, buf)
+    return buf.getvalue().to_pybytes()
+
 # Initialize Data Stream
-df = load_live_traffic()
+df = _load_live_traffic_cached().copy()
+
+# Threat mask computed once per rerun and reused by every view
+is_anom = (df["anomaly_label"] == "Anomaly").to_numpy()
 
 # ======================================================
 # MODULE 5: SIDEBAR & STATE CONTROLS
@@ -221,6 +265,7 @@ st.sidebar.markdown("---")
 # Manual Cache Invalidation Trigger
 if st.sidebar.button("🔄 Refresh System"):
     st.cache_data.clear()
+    st.cache_resource.clear()
     st.rerun()
 
 # Polling Toggle (Default: False to prevent infinite loop on load)
@@ -244,15 +289,20 @@ st.sidebar.markdown("""
 # MODULE 6: MAIN VIEW CONTROLLER
 # ======================================================
 
-# Apply DataFrame Filtering based on Sidebar State
-view_df = df.copy()
+# Apply DataFrame Filtering based on Sidebar State (read-only, no defensive copy)
+# view_is_anom keeps the threat mask aligned with view_df rows
 if scope == "Active Threats Only":
-    view_df = view_df[view_df["anomaly_label"] == "Anomaly"]
+    view_df = df[is_anom]
+    view_is_anom = is_anom[is_anom]
 elif scope == "Normal Traffic":
-    view_df = view_df[view_df["anomaly_label"] == "Normal"]
+    view_df = df[~is_anom]
+    view_is_anom = is_anom[~is_anom]
+else:
+    view_df = df
+    view_is_anom = is_anom
 
 # Compute Aggregate Metrics
-threat_count = len(df[df["anomaly_label"] == "Anomaly"])
+threat_count = int(is_anom.sum())
 status_color = "#ff4b4b" if threat_count > 0 else "#00ff99"
 status_text = f"HIGH ALERT: {threat_count} THREATS DETECTED" if threat_count > 0 else "SYSTEM SECURE"
 
@@ -276,74 +326,124 @@ st.markdown("---")
 # ======================================================
 # MODULE 7: VIEW COMPONENTS (TABS)
 # ======================================================
-tab1, tab2, tab3, tab4 = st.tabs([
+# st.tabs executes every tab body on each rerun; a radio selector lets
+# only the active view run its (figure-building) code
+VIEWS = [
     "📊 TACTICAL OVERVIEW", 
     "🌍 GEO THREAT MAP", 
     "📋 TRAFFIC LOGS", 
     "⚡ RESPONSE"
-])
+]
+active_view = st.radio(
+    "View", VIEWS, horizontal=True,
+    label_visibility="collapsed", key="active_view"
+)
+
+# --- FIGURE BUILDERS ---
+# Cached on lightweight inputs so reruns only rebuild charts when data/filters change
+# (bounded and expiring with the 5s data TTL so live mode does not accumulate figures)
+@st.cache_data(ttl=5, max_entries=8)
+def build_pie(counts_dict):
+    """Threat classification donut from a {label: count} mapping."""
+    fig_pie = px.pie(
+        names=list(counts_dict.keys()), values=list(counts_dict.values()), hole=0.6,
+        color=list(counts_dict.keys()), color_discrete_map={"Normal": "#00cc96", "Anomaly": "#ff4b4b"}
+    )
+    fig_pie.update_layout(paper_bgcolor="rgba(0,0,0,0)", font_color="white", showlegend=True)
+    return fig_pie
+
+@st.cache_data(ttl=5, max_entries=8)
+def build_hist(req_per_min, is_anomaly):
+    """
+    Request velocity histogram from raw req_per_min and boolean threat mask.
+    Bins server-side with np.histogram so only 40 bars per label reach the browser.
+    Both arguments are numeric arrays, so the cache key hashes their contents.
+    """
+    bins = np.linspace(20, 3000, 41)
+    centers = 0.5 * (bins[1:] + bins[:-1])
+    fig_hist = go.Figure()
+    for label, color, mask in (
+        ("Normal", "#00cc96", ~is_anomaly), ("Anomaly", "#ff4b4b", is_anomaly)
+    ):
+        values = req_per_min[mask]
+        if values.size == 0:
+            continue
+        counts, _ = np.histogram(values, bins=bins)
+        fig_hist.add_trace(go.Bar(
+            x=centers, y=counts, width=np.diff(bins),
+            name=label, opacity=0.6, marker_color=color
+        ))
+    fig_hist.update_layout(
+        barmode="overlay",
+        paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+        font_color="white", xaxis_title="Requests/Min", yaxis_title="Count",
+        legend_title_text="anomaly_label"
+    )
+    return fig_hist
+
+@st.cache_data(ttl=5, max_entries=8)
+def build_map(df_map_subset):
+    """Geo threat scatter from the downsampled lat/lon/risk_score/ip subset."""
+    fig_map = px.scatter_geo(
+        df_map_subset,
+        lat="lat", lon="lon",
+        color="risk_score",
+        size="risk_score",
+        scope="asia",
+        projection="natural earth",
+        color_continuous_scale="reds",
+        hover_name="ip"
+    )
+    fig_map.update_geos(
+        visible=True, resolution=50,
+        showcountries=True, countrycolor="#00ffff",
+        showland=True, landcolor="#0b1426",
+        showocean=True, oceancolor="#000510"
+    )
+    fig_map.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        margin={"r":0,"t":0,"l":0,"b":0},
+        font_color="white"
+    )
+    return fig_map
 
 # --- VIEW: TACTICAL ANALYTICS ---
-with tab1:
+if active_view == VIEWS[0]:
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Threat Classification")
         counts = view_df["anomaly_label"].value_counts()
-        fig_pie = px.pie(
-            names=counts.index, values=counts.values, hole=0.6,
-            color=counts.index, color_discrete_map={"Normal": "#00cc96", "Anomaly": "#ff4b4b"}
-        )
-        fig_pie.update_layout(paper_bgcolor="rgba(0,0,0,0)", font_color="white", showlegend=True)
+        fig_pie = build_pie(counts[counts > 0].to_dict()) # Drop empty categories
         st.plotly_chart(fig_pie, use_container_width=True)
         
     with col2:
         st.subheader("Request Velocity")
-        fig_hist = px.histogram(
-            view_df, x="req_per_min", color="anomaly_label", barmode="overlay",
-            color_discrete_map={"Normal": "#00cc96", "Anomaly": "#ff4b4b"}
-        )
-        fig_hist.update_layout(
-            paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-            font_color="white", xaxis_title="Requests/Min", yaxis_title="Count"
-        )
+        fig_hist = build_hist(view_df["req_per_min"].to_numpy(), view_is_anom)
         st.plotly_chart(fig_hist, use_container_width=True)
 
 # --- VIEW: GEOSPATIAL INTELLIGENCE ---
-with tab2:
+elif active_view == VIEWS[1]:
     st.subheader("📍 Indian Ocean Threat Theater")
-    threat_map_data = df[df["anomaly_label"] == "Anomaly"]
+    threat_map_data = df[is_anom]
     
     if not threat_map_data.empty:
-        # Downsample for rendering performance (limit to 1000 points)
-        display_map_data = threat_map_data.sample(min(len(threat_map_data), 1000))
+        # Downsample for rendering performance (limit to 1000 points):
+        # always keep the 200 highest-risk threats, fill the rest at random
+        # (seeded so the same data yields the same subset and hits the figure cache)
+        top_threats = threat_map_data.nlargest(200, "risk_score")
+        remaining = threat_map_data.drop(top_threats.index)
+        display_map_data = pd.concat([
+            top_threats,
+            remaining.sample(min(len(remaining), 800), random_state=0)
+        ])
         
-        fig_map = px.scatter_geo(
-            display_map_data,
-            lat="lat", lon="lon",
-            color="risk_score",
-            size="risk_score",
-            scope="asia",
-            projection="natural earth",
-            color_continuous_scale="reds",
-            hover_name="ip"
-        )
-        fig_map.update_geos(
-            visible=True, resolution=50,
-            showcountries=True, countrycolor="#00ffff",
-            showland=True, landcolor="#0b1426",
-            showocean=True, oceancolor="#000510"
-        )
-        fig_map.update_layout(
-            paper_bgcolor="rgba(0,0,0,0)",
-            margin={"r":0,"t":0,"l":0,"b":0},
-            font_color="white"
-        )
+        fig_map = build_map(display_map_data[["lat", "lon", "risk_score", "ip"]])
         st.plotly_chart(fig_map, use_container_width=True)
     else:
         st.info("No localized threats in this sector.")
 
 # --- VIEW: TELEMETRY LOGS ---
-with tab3:
+elif active_view == VIEWS[2]:
     st.subheader("📋 Intercepted Signal Logs")
     
     # Render Data Grid (Head 1000 for DOM performance)
@@ -355,7 +455,7 @@ with tab3:
     st.caption(f"Displaying most recent 1,000 of {len(view_df):,} records. Download full log below.")
     
     # Export Controller
-    csv_data = view_df.to_csv(index=False).encode('utf-8')
+    csv_data = make_csv(view_df)
     st.download_button(
         label="💾 DOWNLOAD FULL WATCH LOG (CSV)",
         data=csv_data,
@@ -365,10 +465,10 @@ with tab3:
     )
 
 # --- VIEW: INCIDENT RESPONSE ---
-with tab4:
+elif active_view == VIEWS[3]:
     st.subheader("⚡ Active Threat Response")
     
-    active_threats = df[df["anomaly_label"] == "Anomaly"]
+    active_threats = df[is_anom]
     
     if active_threats.empty:
         st.success("✅ SECTOR CLEAR. NO ACTIVE TARGETS.")
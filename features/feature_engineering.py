@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import os
 
@@ -7,15 +8,18 @@ os.makedirs("data/processed", exist_ok=True)
 RAW_FILE = "data/raw/traffic_logs.csv"
 OUTPUT_FILE = "data/processed/features.csv"
 
-# Load raw traffic logs
-df = pd.read_csv(RAW_FILE)
-
-# Convert timestamp to datetime
-df["timestamp"] = pd.to_datetime(df["timestamp"])
+# Load raw traffic logs (timestamp parsed to datetime by Arrow's C++ reader)
+df = pd.read_csv(RAW_FILE, engine="pyarrow", parse_dates=["timestamp"])
 
 # Create 1-minute time window
 df["time_window"] = df["timestamp"].dt.floor("T")
 
+# Store endpoint as categorical so nunique works on compact integer codes
+df["endpoint"] = df["endpoint"].astype("category")
+
+# Per-request error flag so error_rate aggregates as a plain mean
+df["is_error"] = (df["status"] >= 400).astype(np.uint8)
+
 # Group by IP and time window
 grouped = df.groupby(["ip", "time_window"])
 
@@ -23,7 +27,7 @@ grouped = df.groupby(["ip", "time_window"])
 features = grouped.agg(
     req_per_min=("ip", "count"),
     avg_resp_time=("resp_time", "mean"),
-    error_rate=("status", lambda x: (x >= 400).mean()),
+    error_rate=("is_error", "mean"),
     avg_req_size=("req_size", "mean"),
     unique_endpoints=("endpoint", "nunique")
 ).reset_index()
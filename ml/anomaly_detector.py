@@ -9,6 +9,7 @@ Key design rule:
   those used during training. This file enforces that contract.
 """
 
+import numpy as np
 import pandas as pd
 import joblib
 import os
@@ -28,7 +29,7 @@ def run_anomaly_detection(input_file=DATA_FILE):
 
     Steps:
     1. Load engineered feature data
-    2. Load trained model
+    2. Load trained model and its training feature schema
     3. Align inference features EXACTLY with training schema
     4. Predict anomaly scores and labels
     5. Save results for downstream processing
@@ -37,25 +38,18 @@ def run_anomaly_detection(input_file=DATA_FILE):
     # -------------------------------
     # Load feature data
     # -------------------------------
-    df = pd.read_csv(input_file)
+    df = pd.read_csv(input_file, engine="pyarrow")
 
     # -------------------------------
-    # Load trained model
+    # Load trained model bundle
     # -------------------------------
-    model = joblib.load(MODEL_FILE)
+    bundle = joblib.load(MODEL_FILE)
 
     # -------------------------------
     # 🔐 CRITICAL STEP:
-    # Use model's own feature schema
+    # Use the feature schema saved alongside the model
     # -------------------------------
-    if not hasattr(model, "feature_names_in_"):
-        raise RuntimeError(
-            "Model does not contain feature_names_in_. "
-            "This usually means it was trained using a NumPy array "
-            "instead of a DataFrame."
-        )
-
-    feature_columns = list(model.feature_names_in_)
+    model, feature_columns = bundle["model"], bundle["features"]
 
     # Validate required columns exist
     missing = [col for col in feature_columns if col not in df.columns]
@@ -68,8 +62,11 @@ def run_anomaly_detection(input_file=DATA_FILE):
     # -------------------------------
     # Model inference
     # -------------------------------
-    df["anomaly_score"] = model.decision_function(X)
-    df["anomaly"] = model.predict(X)
+    # predict() is just decision_function() < 0, so derive labels from the
+    # scores instead of traversing every tree a second time
+    scores = model.decision_function(X)
+    df["anomaly_score"] = scores
+    df["anomaly"] = np.where(scores < 0, -1, 1)
 
     # Convert model output to readable labels
     df["anomaly_label"] = df["anomaly"].apply(
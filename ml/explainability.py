@@ -11,6 +11,7 @@ Approach:
 This supports analyst trust and auditability.
 """
 
+import numpy as np
 import pandas as pd
 
 DATA_FILE = "data/processed/anomaly_results.csv"
@@ -27,7 +28,7 @@ def generate_explanations(df=None):
 
     # Load data if not provided
     if df is None:
-        df = pd.read_csv(DATA_FILE)
+        df = pd.read_csv(DATA_FILE, engine="pyarrow")
 
     # Separate normal traffic to learn baseline behavior
     normal_df = df[df["anomaly_label"] == "Normal"]
@@ -40,41 +41,50 @@ def generate_explanations(df=None):
         (df["req_per_min"] / baseline["req_per_min"]).round(2)
     )
 
-    def explain_row(row):
-        """
-        Generates explanation text for a single record
-        by checking deviations across multiple features.
-        """
-        reasons = []
-
-        if row["req_per_min"] > baseline["req_per_min"] * 2:
-            reasons.append(
-                f"Request rate exceeded baseline by {row['req_rate_deviation']}×"
-            )
-
-        if row["error_rate"] > baseline["error_rate"] * 2:
-            reasons.append("Unusually high error rate observed")
-
-        if row["avg_resp_time"] > baseline["avg_resp_time"] * 1.5:
-            reasons.append("Response time significantly higher than baseline")
-
-        if "avg_req_size" in row and row["avg_req_size"] > baseline.get("avg_req_size", 0) * 1.5:
-            reasons.append("Abnormally large request payloads")
-
-        if "unique_endpoints" in row and row["unique_endpoints"] > baseline.get("unique_endpoints", 0) * 1.5:
-            reasons.append("Accessing unusually high number of endpoints")
-
-        if not reasons:
-            reasons.append("Multiple feature deviations from learned baseline")
-
-        return "; ".join(reasons)
+    # Deviation checks as (mask, reason) pairs evaluated over whole columns
+    checks = [
+        (
+            df["req_per_min"] > baseline["req_per_min"] * 2,
+            "Request rate exceeded baseline by "
+            + df["req_rate_deviation"].astype(str) + "×"
+        ),
+        (
+            df["error_rate"] > baseline["error_rate"] * 2,
+            "Unusually high error rate observed"
+        ),
+        (
+            df["avg_resp_time"] > baseline["avg_resp_time"] * 1.5,
+            "Response time significantly higher than baseline"
+        ),
+    ]
+
+    if "avg_req_size" in df.columns:
+        checks.append((
+            df["avg_req_size"] > baseline.get("avg_req_size", 0) * 1.5,
+            "Abnormally large request payloads"
+        ))
+
+    if "unique_endpoints" in df.columns:
+        checks.append((
+            df["unique_endpoints"] > baseline.get("unique_endpoints", 0) * 1.5,
+            "Accessing unusually high number of endpoints"
+        ))
+
+    # Accumulate "; "-separated reasons for every record in one pass per check
+    reasons = pd.Series("", index=df.index, dtype=object)
+    for mask, reason in checks:
+        separator = np.where(reasons == "", "", "; ")
+        reasons = reasons.mask(mask, reasons + separator + reason)
+
+    reasons = reasons.where(
+        reasons != "", "Multiple feature deviations from learned baseline"
+    )
 
     # Apply explanations
-    df["explanation"] = df.apply(
-        lambda row: explain_row(row)
-        if row["anomaly_label"] == "Anomaly"
-        else "Traffic behavior within normal baseline",
-        axis=1
+    df["explanation"] = np.where(
+        df["anomaly_label"] == "Anomaly",
+        reasons,
+        "Traffic behavior within normal baseline"
     )
 
     # Save output for dashboard / debugging
@@ -8,6 +8,7 @@ Features → Anomaly Detection → Explainability → Risk & Rules → Dashboard
 """
 
 import os
+import numpy as np
 import pandas as pd
 
 from anomaly_detector import run_anomaly_detection
@@ -38,23 +39,22 @@ def assign_severity_and_action(df):
     Converts risk score into severity levels and mitigation actions.
     """
 
-    def severity(score):
-        if score >= 7:
-            return "High"
-        elif score >= 4:
-            return "Medium"
-        return "Low"
-
-    df["severity"] = df["risk_score"].apply(severity)
-
-    def action(row):
-        if row["severity"] == "High":
-            return "Block IP and alert SOC immediately"
-        elif row["severity"] == "Medium":
-            return "Apply rate limiting and monitor closely"
-        return "Allow traffic and continue monitoring"
-
-    df["recommended_action"] = df.apply(action, axis=1)
+    # [0, 4) Low, [4, 7) Medium, [7, 10] High
+    df["severity"] = pd.cut(
+        df["risk_score"],
+        bins=[-np.inf, 4, 7, np.inf],
+        labels=["Low", "Medium", "High"],
+        right=False
+    )
+
+    df["recommended_action"] = np.select(
+        [df["severity"] == "High", df["severity"] == "Medium"],
+        [
+            "Block IP and alert SOC immediately",
+            "Apply rate limiting and monitor closely"
+        ],
+        default="Allow traffic and continue monitoring"
+    )
 
     return df
 
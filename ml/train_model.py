@@ -13,7 +13,7 @@ MODEL_FILE = os.path.join(MODEL_DIR, "isolation_forest.pkl")
 os.makedirs(MODEL_DIR, exist_ok=True)
 
 # Load feature data
-df = pd.read_csv(DATA_FILE)
+df = pd.read_csv(DATA_FILE, engine="pyarrow")
 
 # Drop non-feature columns
 X = df.drop(columns=["ip"])
@@ -27,7 +27,11 @@ model = IsolationForest(
 
 model.fit(X)
 
-# Save trained model
-joblib.dump(model, MODEL_FILE)
+# Save trained model together with its feature schema (compressed bundle)
+joblib.dump(
+    {"model": model, "features": list(X.columns)},
+    MODEL_FILE,
+    compress=3
+)
 
 print(f"[✓] Model trained and saved at: {MODEL_FILE}")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import os
 
@@ -7,59 +8,62 @@ OUTPUT_FILE = "data/processed/rule_recommendations.csv"
 os.makedirs("data/processed", exist_ok=True)
 
 # Load data
-df = pd.read_csv(INPUT_FILE)
+df = pd.read_csv(INPUT_FILE, engine="pyarrow")
 
 # ------------------ RISK SCORING ------------------
 
-def calculate_risk(row):
+def calculate_risk(df):
     score = 0
 
     # Request rate impact (max 30)
-    score += min(row["req_per_min"] * 0.5, 30)
+    score += np.minimum(df["req_per_min"] * 0.5, 30)
 
     # Error rate impact (max 40)
-    score += row["error_rate"] * 40
+    score += df["error_rate"] * 40
 
     # Burst behavior impact (max 30)
-    score += row["burst_score"] * 30
+    score += df["burst_score"] * 30
 
-    return int(min(score, 100))
+    return np.minimum(score, 100).astype(int)
 
 
-df["risk_score"] = df.apply(calculate_risk, axis=1)
+df["risk_score"] = calculate_risk(df)
 
 
 def assign_severity(score):
-    if score >= 70:
-        return "High"
-    elif score >= 40:
-        return "Medium"
-    else:
-        return "Low"
+    # [0, 40) Low, [40, 70) Medium, [70, 100] High
+    return pd.cut(
+        score,
+        bins=[-1, 40, 70, 101],
+        labels=["Low", "Medium", "High"],
+        right=False
+    )
 
 
-df["severity"] = df["risk_score"].apply(assign_severity)
+df["severity"] = assign_severity(df["risk_score"])
 
 
-def recommend_rule(row):
-    if row["anomaly_label"] != "Anomaly":
-        return "No action required"
+def recommend_rule(df):
+    explanation = df["explanation"].str.lower()
 
-    explanation = row["explanation"].lower()
+    # First matching condition wins, mirroring the original if-chain
+    conditions = [
+        df["anomaly_label"] != "Anomaly",
+        explanation.str.contains("high request rate", na=False),
+        explanation.str.contains("error rate", na=False),
+        explanation.str.contains("payload", na=False)
+    ]
+    actions = [
+        "No action required",
+        "Rate limit IP for 5 minutes",
+        "Temporarily block IP",
+        "Inspect payload and block if repeated"
+    ]
 
-    if "high request rate" in explanation:
-        return "Rate limit IP for 5 minutes"
-
-    if "error rate" in explanation:
-        return "Temporarily block IP"
-
-    if "payload" in explanation:
-        return "Inspect payload and block if repeated"
-
-    return "Monitor traffic closely"
+    return np.select(conditions, actions, default="Monitor traffic closely")
 
 # Generate rule recommendations
-df["recommended_action"] = df.apply(recommend_rule, axis=1)
+df["recommended_action"] = recommend_rule(df)
 
 # Save rules
 df.to_csv(OUTPUT_FILE, index=False)
@@ -1,6 +1,6 @@
-import csv
-import random
-from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from datetime import datetime
 import os
 
 # Ensure data directory exists
@@ -14,85 +14,76 @@ METHODS = ["GET", "POST"]
 USER_AGENTS = ["Mozilla/5.0", "Chrome/120.0", "Safari/15.0", "bot-agent"]
 
 # ---------------- NORMAL TRAFFIC ----------------
-def generate_normal_request(timestamp):
-    return {
-        "timestamp": timestamp,
-        "ip": random.choice(IPS),
-        "endpoint": random.choice(ENDPOINTS[:-1]),
-        "method": random.choice(METHODS),
-        "status": random.choice([200, 200, 200, 404]),
-        "req_size": random.randint(200, 800),
-        "resp_time": random.randint(80, 250),
-        "user_agent": random.choice(USER_AGENTS[:-1])
-    }
+def generate_normal_requests(timestamps):
+    n = len(timestamps)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "ip": np.random.choice(IPS, n),
+        "endpoint": np.random.choice(ENDPOINTS[:-1], n),
+        "method": np.random.choice(METHODS, n),
+        "status": np.random.choice([200, 200, 200, 404], n),
+        "req_size": np.random.randint(200, 801, n),
+        "resp_time": np.random.randint(80, 251, n),
+        "user_agent": np.random.choice(USER_AGENTS[:-1], n)
+    })
 
 # ---------------- BURST ATTACK ----------------
-def generate_attack_request(timestamp):
-    return {
-        "timestamp": timestamp,
-        "ip": random.choice(["10.0.0.99", "10.0.0.100"]),
-        "endpoint": random.choice(["/login", "/api/login", "/admin"]),
+def generate_attack_requests(timestamps):
+    n = len(timestamps)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "ip": np.random.choice(["10.0.0.99", "10.0.0.100"], n),
+        "endpoint": np.random.choice(["/login", "/api/login", "/admin"], n),
         "method": "POST",
-        "status": random.choice([401, 403, 500]),
-        "req_size": random.randint(900, 2000),
-        "resp_time": random.randint(300, 800),
+        "status": np.random.choice([401, 403, 500], n),
+        "req_size": np.random.randint(900, 2001, n),
+        "resp_time": np.random.randint(300, 801, n),
         "user_agent": "bot-agent"
-    }
+    })
 
 # ---------------- STEALTH ATTACK (LOW & SLOW) ----------------
-def generate_stealth_attack(timestamp):
-    return {
-        "timestamp": timestamp,
+def generate_stealth_attacks(timestamps):
+    n = len(timestamps)
+    return pd.DataFrame({
+        "timestamp": timestamps,
         "ip": "10.0.0.200",              # same IP always
         "endpoint": "/api/login",        # sensitive endpoint
         "method": "POST",
-        "status": random.choice([401, 403]),
-        "req_size": random.randint(650, 850),
-        "resp_time": random.randint(220, 350),
+        "status": np.random.choice([401, 403], n),
+        "req_size": np.random.randint(650, 851, n),
+        "resp_time": np.random.randint(220, 351, n),
         "user_agent": "Mozilla/5.0"      # looks human
-    }
+    })
 
 # ---------------- MAIN TRAFFIC GENERATION ----------------
 def generate_traffic(minutes=15):
     start_time = datetime.now()
-    rows = []
+    minute_times = pd.date_range(start=start_time, periods=minutes, freq="min")
+    minute_idx = np.arange(minutes)
 
-    for minute in range(minutes):
-        current_time = start_time + timedelta(minutes=minute)
+    # Normal traffic
+    normal_counts = np.random.randint(30, 61, minutes)
 
-        # Normal traffic
-        for _ in range(random.randint(30, 60)):
-            rows.append(generate_normal_request(current_time))
+    # Burst attack (obvious)
+    attack_counts = np.where(
+        minute_idx % 4 == 0, np.random.randint(20, 41, minutes), 0
+    )
 
-        # Burst attack (obvious)
-        if minute % 4 == 0:
-            for _ in range(random.randint(20, 40)):
-                rows.append(generate_attack_request(current_time))
+    # Stealth attack (low & slow, hard to detect)
+    stealth_counts = (minute_idx >= 6).astype(int)
 
-        # Stealth attack (low & slow, hard to detect)
-        if minute >= 6:
-            rows.append(generate_stealth_attack(current_time))
+    df = pd.concat([
+        generate_normal_requests(minute_times.repeat(normal_counts)),
+        generate_attack_requests(minute_times.repeat(attack_counts)),
+        generate_stealth_attacks(minute_times.repeat(stealth_counts))
+    ], ignore_index=True)
 
-    return rows
+    # Restore per-minute ordering: normal, burst, stealth
+    return df.sort_values("timestamp", kind="stable", ignore_index=True)
 
 # ---------------- SAVE TO CSV ----------------
-def save_to_csv(rows):
-    with open(OUTPUT_FILE, "w", newline="") as file:
-        writer = csv.DictWriter(
-            file,
-            fieldnames=[
-                "timestamp",
-                "ip",
-                "endpoint",
-                "method",
-                "status",
-                "req_size",
-                "resp_time",
-                "user_agent"
-            ]
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+def save_to_csv(df):
+    df.to_csv(OUTPUT_FILE, index=False)
 
 # ---------------- RUN ----------------
 if __name__ == "__main__":